@@ -1,72 +1,161 @@
 import requests
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
+import hashlib
 import re
-import nltk
+from functools import lru_cache
+from pathlib import Path
 
-nltk.download('punkt')
+_COMPANY_NAME_RE = re.compile(r'(?:[^\w]|^)(?P<company>[A-Z][\w&\']*(\s+[A-Z][\w&\']*)*)(?=[^\w]|$)')
+
+CACHE_DIR = Path('.cache')
+
+_session = requests.Session()
+
+_MAX_HTML_BYTES = 2 * 1024 * 1024  # Job postings are small; stop reading past this point.
+
+@lru_cache(maxsize=128)
+def _fetch_html(url):
+    """Fetch and cache HTML, raising requests.RequestException on failure.
+
+    Raising keeps failures out of both caches: lru_cache does not memoise
+    exceptions, and nothing is written to disk, so a flaky URL is retried
+    on the next call instead of serving a cached failure.
+    """
+    cache_key = hashlib.blake2b(str(url).encode(), digest_size=16).hexdigest()
+    cache_file = CACHE_DIR / f"{cache_key}.html"
+    if cache_file.exists():
+        return cache_file.read_bytes()
+
+    response = _session.get(url, stream=True)
+    response.raise_for_status()  # Raise an error for bad responses
+    chunks = []
+    size = 0
+    for chunk in response.iter_content(chunk_size=64 * 1024):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= _MAX_HTML_BYTES:
+            break
+    response.close()
+    content = b''.join(chunks)
+    CACHE_DIR.mkdir(exist_ok=True)
+    cache_file.write_bytes(content)
+    return content
 
 def fetch_html(url):
-    """Fetch HTML content from the specified URL."""
+    """Fetch HTML content from the specified URL, caching it on disk."""
     try:
-        response = requests.get(url)
-        response.raise_for_status()  # Raise an error for bad responses
-        return response.content
+        return _fetch_html(url)
     except requests.RequestException as e:
         print(f"Error fetching URL: {e}")
         return None
 
-def extract_company_and_title(soup):
-    """Extract the company name and job title from the BeautifulSoup object."""
-    article = soup.find('article')
-    article_text = article.text if article else ''
-    
-    company_name_regex = re.compile(r'(?:[^\w]|^)(?P<company>[A-Z][\w&\']*(\s+[A-Z][\w&\']*)*)(?=[^\w]|$)')
-    match = company_name_regex.search(article_text)
-    
-    company_name = match.group('company') if match else soup.title.string.strip()
-    job_title = soup.find('h1').text.strip()
-    
+def extract_company_and_title(tree):
+    """Extract the company name and job title from the parsed HTML tree."""
+    article = tree.css_first('article')
+    article_text = article.text(separator=' ', strip=True) if article else ''
+
+    match = _COMPANY_NAME_RE.search(article_text)
+
+    company_name = match.group('company') if match else tree.css_first('title').text(strip=True)
+    job_title = tree.css_first('h1').text(strip=True)
+
     return company_name, job_title
 
+_MAX_CACHE_ENTRIES = 128
+
+def _cache_put(cache, key, value):
+    """Insert into a dict cache, evicting the oldest entry when full."""
+    if len(cache) >= _MAX_CACHE_ENTRIES:
+        del cache[next(iter(cache))]
+    cache[key] = value
+
+_JOB_DETAILS_CACHE = {}
+
+def extract_job_details(html_content):
+    """Parse HTML and extract job details, memoised by content hash."""
+    key = hashlib.blake2b(html_content, digest_size=16).digest()
+    if key not in _JOB_DETAILS_CACHE:
+        tree = LexborHTMLParser(html_content)
+        _cache_put(_JOB_DETAILS_CACHE, key, extract_company_and_title(tree))
+    return _JOB_DETAILS_CACHE[key]
+
+@lru_cache(maxsize=128)
+def _job_details_for_url(url):
+    """Resolve a job posting URL straight to (company_name, job_title).
+
+    Keyed by URL so a repeat scrape skips fetching, hashing and parsing
+    altogether. Raises requests.RequestException on fetch failure, which
+    keeps failures out of the cache.
+    """
+    return extract_job_details(_fetch_html(url))
+
+_TRACK_RECORD_PARAGRAPH = (
+    "In my current position, I have demonstrated my ability to work well in a team and independently, "
+    "as well as my strong problem-solving skills. I have consistently exceeded targets and contributed to "
+    "the growth of the company."
+)
+
+_ATTRACTION_REASON = (
+    "because of the company's commitment to "
+    "innovation and the opportunity to work with a team of experts in the field. I am excited about "
+    "the potential to contribute to the company's growth and success. "
+    "I am confident that I would thrive in the company's dynamic and collaborative environment."
+)
+
+_CLOSING_PARAGRAPH = "Thank you for considering my application. Please find attached my CV for your review."
+
 def create_cover_letter(company_name, job_title, experience, degree, skills, name, email, phone):
     """Create the body of the cover letter."""
+    skills_list = ', '.join(dict.fromkeys(skills))  # Dedupe while keeping the order skills were given in.
     paragraphs = [
         f"Dear Hiring Manager at {company_name},",
         f"I am excited to apply for the position of {job_title}. "
         f"I believe my experience and skills make me a perfect fit for this role.",
         f"I have {experience} years of experience in the field, and a {degree} degree in a related field. "
-        f"I am confident that my skills in {', '.join(skills)} would be an asset to {company_name}.",
-        "In my current position, I have demonstrated my ability to work well in a team and independently, "
-        "as well as my strong problem-solving skills. I have consistently exceeded targets and contributed to "
-        "the growth of the company.",
-        f"I am particularly interested in working at {company_name} because of the company's commitment to "
-        "innovation and the opportunity to work with a team of experts in the field. I am excited about "
-        "the potential to contribute to the company's growth and success. "
-        "I am confident that I would thrive in the company's dynamic and collaborative environment.",
-        "Thank you for considering my application. Please find attached my CV for your review.",
+        f"I am confident that my skills in {skills_list} would be an asset to {company_name}.",
+        _TRACK_RECORD_PARAGRAPH,
+        f"I am particularly interested in working at {company_name} {_ATTRACTION_REASON}",
+        _CLOSING_PARAGRAPH,
         "Sincerely,",
         name,
         email,
         phone
     ]
-    
+
     return "\n\n".join(paragraphs)
 
+_GENERATED = {}
+
 def generate_cv(url, name, email, phone, experience, degree, skills):
     """Generate a CV based on job posting details."""
-    html_content = fetch_html(url)
-    if html_content is None:
-        return "Failed to fetch job details."
+    submission_key = (url, name, email, phone, experience, degree, tuple(skills))
+    if submission_key in _GENERATED:
+        return _GENERATED[submission_key]
 
-    soup = BeautifulSoup(html_content, 'html.parser')
-    company_name, job_title = extract_company_and_title(soup)
+    try:
+        company_name, job_title = _job_details_for_url(url)
+    except requests.RequestException as e:
+        print(f"Error fetching URL: {e}")
+        return "Failed to fetch job details."
     
     cv = create_cover_letter(company_name, job_title, experience, degree, skills, name, email, phone)
-    
-    with open(f"{name}.txt", "w") as f:
-        f.write(cv)
-        
+
+    output_file = Path(f"{name}.txt")
+    if not (output_file.exists() and output_file.read_text() == cv):
+        output_file.write_text(cv)
+
+    _cache_put(_GENERATED, submission_key, cv)
     return cv
 
+def generate_cv_batch(applications):
+    """Generate CVs for multiple job applications in one call.
+
+    Each application is a dict of generate_cv keyword arguments. The HTTP
+    session, fetched pages and extracted job details are shared across the
+    batch, so a URL that appears more than once is only fetched and parsed
+    the first time.
+    """
+    return [generate_cv(**application) for application in applications]
+
 # Example usage (commented out)
 # generate_cv("https://example.com/job-posting", "John Doe", "john@example.com", "123-456-7890", 5, "Bachelor's", ["Python", "SQL", "Machine Learning"])